@@ -0,0 +1,39 @@
+use anyhow::Result;
+use clap::CommandFactory;
+use serde_json::json;
+
+use crate::output::Output;
+
+/// Emit every subcommand path with its help render status as JSON.
+///
+/// The Python CLI tests consume this to verify the whole help surface with a
+/// single subprocess instead of one `--help` invocation per subcommand.
+pub fn list_commands_cmd(output: &Output) -> Result<()> {
+    let mut root = super::Cli::command();
+    let mut entries = Vec::new();
+    collect(&mut root, &mut Vec::new(), &mut entries);
+    output.emit_json(&json!({ "commands": entries }))
+}
+
+fn collect(
+    cmd: &mut clap::Command,
+    path: &mut Vec<String>,
+    entries: &mut Vec<serde_json::Value>,
+) {
+    let help_ok = !cmd.render_help().to_string().trim().is_empty();
+    entries.push(json!({ "path": path.clone(), "help_ok": help_ok }));
+
+    // collect names first; find_subcommand_mut needs its own borrow of cmd
+    let names: Vec<String> = cmd
+        .get_subcommands()
+        .map(|sub| sub.get_name().to_string())
+        .filter(|name| name != "help")
+        .collect();
+    for name in names {
+        if let Some(sub) = cmd.find_subcommand_mut(&name) {
+            path.push(name);
+            collect(sub, path, entries);
+            path.pop();
+        }
+    }
+}
@@ -23,6 +23,7 @@ use crate::{
 pub mod auth;
 pub mod chat;
 pub mod common;
+pub mod debug;
 pub mod file;
 pub mod init_cli;
 pub mod list;
@@ -169,6 +170,22 @@ pub enum Commands {
     /// Run the bounded Anytype MCP server or its maintenance commands
     #[cfg(feature = "mcp")]
     Mcp(McpArgs),
+
+    /// Introspection helpers for the test suite
+    #[command(hide = true)]
+    Debug(DebugArgs),
+}
+
+#[derive(Args, Debug)]
+pub struct DebugArgs {
+    #[command(subcommand)]
+    pub command: DebugCommands,
+}
+
+#[derive(Subcommand, Debug)]
+pub enum DebugCommands {
+    /// Emit every subcommand path and its help render status
+    ListCommands,
 }
 
 /// Arguments passed through unchanged to the embedded any-mcp process.
@@ -1710,6 +1727,13 @@ pub async fn run(mut cli: Cli) -> Result<()> {
         return auth::find_grpc_cmd(&output, program).await;
     }
 
+    if let Commands::Debug(DebugArgs {
+        command: DebugCommands::ListCommands,
+    }) = cli.command
+    {
+        return debug::list_commands_cmd(&output);
+    }
+
     let date_format = resolve_table_date_format(&cli);
 
     let client = build_client(&cli)?;
@@ -1747,6 +1771,7 @@ pub async fn run(mut cli: Cli) -> Result<()> {
         }
         #[cfg(feature = "mcp")]
         Commands::Mcp(_) => unreachable!("MCP is dispatched before the standard runtime"),
+        Commands::Debug(_) => unreachable!("handled before client init"),
     }
 }
 
@@ -1,121 +1,329 @@
 #!/usr/bin/env python
 
+import asyncio
+import functools
 import json
 import os
+import selectors
 import shutil
 import subprocess
 import tempfile
 import time
 import unittest
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib parser
+    orjson = None
 
+try:
+    import simdjson
+except ImportError:  # lazy parsing is optional
+    simdjson = None
+
+
+@functools.lru_cache(maxsize=1)
 def anyr_bin() -> str | None:
     return os.environ.get("ANYR_BIN") or shutil.which("anyr")
 
 
-def base_env() -> dict:
-    env = os.environ.copy()
+@functools.lru_cache(maxsize=1)
+def _install_env_overrides() -> None:
+    # apply the test-environment delta to our own environment once and
+    # let every child inherit it via env=None, so no mapping has to be
+    # built or passed per spawn
     # test environment settings override default
-    test_key_path = env.get("ANYTYPE_TEST_KEY_FILE")
+    test_key_path = os.environ.get("ANYTYPE_TEST_KEY_FILE")
     if test_key_path:
-        env["ANYTYPE_KEY_FILE"] = test_key_path
-    test_url = env.get("ANYTYPE_TEST_URL")
+        os.environ["ANYTYPE_KEY_FILE"] = test_key_path
+    test_url = os.environ.get("ANYTYPE_TEST_URL")
     if test_url:
-        env["ANYTYPE_URL"] = test_url
-    return env
+        os.environ["ANYTYPE_URL"] = test_url
+
+
+@functools.lru_cache(maxsize=1)
+def _anyr_argv() -> tuple[str, ...]:
+    # shared argv prefix for every spawn; built once alongside the
+    # cached binary lookup
+    return (anyr_bin(),)
 
 
-def run_help(*args: str) -> subprocess.CompletedProcess[str]:
-    cmd = [anyr_bin(), *args, "--help"]
-    return subprocess.run(
-        cmd, check=False, capture_output=True, text=True, env=base_env()
+_CAPTURE_CHUNK = 65536
+
+
+@functools.lru_cache(maxsize=1)
+def _capture_popen() -> functools.partial:
+    # constant spawn options bound once. close_fds=False lets CPython
+    # spawn via os.posix_spawn instead of fork+exec; the helpers open
+    # no inheritable descriptors, so leaking fds is not a concern
+    _install_env_overrides()
+    return functools.partial(
+        subprocess.Popen,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=None,
+        close_fds=False,
     )
 
 
-def run_anyr(*args: str) -> subprocess.CompletedProcess[str]:
-    cmd = [anyr_bin(), *args]
-    print(f"running cmd: {cmd}")
-    return subprocess.run(
-        cmd, check=False, capture_output=True, text=True, env=base_env()
+def _run_capture(
+    cmd: tuple[str, ...], input_bytes: bytes | None = None
+) -> subprocess.CompletedProcess[bytes]:
+    # explicit Popen capture loop: both pipes are drained with
+    # os.readv into one preallocated chunk buffer, avoiding the
+    # temporary bytes objects communicate() allocates per read
+    proc = _capture_popen()(
+        cmd,
+        stdin=subprocess.PIPE if input_bytes is not None else None,
     )
+    stdout = bytearray()
+    stderr = bytearray()
+    chunk = bytearray(_CAPTURE_CHUNK)
+    view = memoryview(chunk)
+    pending = memoryview(input_bytes) if input_bytes is not None else None
+    with selectors.DefaultSelector() as selector:
+        if proc.stdin is not None:
+            os.set_blocking(proc.stdin.fileno(), False)
+            selector.register(proc.stdin, selectors.EVENT_WRITE, None)
+        for stream, buf in ((proc.stdout, stdout), (proc.stderr, stderr)):
+            os.set_blocking(stream.fileno(), False)
+            selector.register(stream, selectors.EVENT_READ, buf)
+        while selector.get_map():
+            for key, _ in selector.select():
+                if key.events & selectors.EVENT_WRITE:
+                    try:
+                        written = os.write(key.fd, pending)
+                    except BrokenPipeError:
+                        written = len(pending)
+                    pending = pending[written:]
+                    if not len(pending):
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+                    continue
+                try:
+                    count = os.readv(key.fd, [chunk])
+                except BlockingIOError:
+                    continue
+                if count:
+                    key.data.extend(view[:count])
+                else:
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+    return subprocess.CompletedProcess(cmd, proc.wait(), bytes(stdout), bytes(stderr))
+
+
+def _as_text(
+    result: subprocess.CompletedProcess[bytes],
+) -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(
+        result.args,
+        result.returncode,
+        result.stdout.decode(),
+        result.stderr.decode(),
+    )
+
+
+def run_anyr(*args: str) -> subprocess.CompletedProcess[str]:
+    cmd = (*_anyr_argv(), *args)
+    print(f"running cmd: {list(cmd)}")
+    return _as_text(_run_capture(cmd))
 
 
 def run_anyr_with_input(
     input_text: str, *args: str
 ) -> subprocess.CompletedProcess[str]:
-    cmd = [anyr_bin(), *args]
-    print(f"running cmd with stdin: {cmd}")
-    return subprocess.run(
-        cmd,
-        check=False,
-        capture_output=True,
-        text=True,
-        input=input_text,
-        env=base_env(),
-    )
+    cmd = (*_anyr_argv(), *args)
+    print(f"running cmd with stdin: {list(cmd)}")
+    return _as_text(_run_capture(cmd, input_text.encode()))
 
 
-def run_anyr_json(*args: str) -> dict:
-    result = run_anyr(*args, "--json")
+def _json_from_result(
+    args: tuple[str, ...], result: subprocess.CompletedProcess[bytes]
+) -> dict:
+    # all three parsers accept the captured bytes directly, so stdout
+    # is never materialized as str on the success path; stderr and the
+    # failure messages decode lazily
     if result.returncode != 0:
         raise AssertionError(
-            f"command failed: {' '.join(args)}\nstdout: {result.stdout}\nstderr: {result.stderr}"
+            f"command failed: {' '.join(args)}\n"
+            f"stdout: {result.stdout.decode('utf-8', 'replace')}\n"
+            f"stderr: {result.stderr.decode('utf-8', 'replace')}"
         )
     try:
+        if simdjson is not None:
+            # lazy proxies behave like read-only dicts/lists for the key
+            # lookups and iteration the tests perform, so nested values
+            # are only materialized when touched; a fresh parser per call
+            # keeps proxies from earlier calls valid
+            return simdjson.Parser().parse(result.stdout)
+        if orjson is not None:
+            return orjson.loads(result.stdout)
         return json.loads(result.stdout)
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:
+        # orjson.JSONDecodeError and json.JSONDecodeError both subclass
+        # ValueError
         raise AssertionError(
-            f"invalid json for {' '.join(args)}: {exc}\nstdout: {result.stdout}\n"
-            f"stderr: {result.stderr}"
+            f"invalid json for {' '.join(args)}: {exc}\n"
+            f"stdout: {result.stdout.decode('utf-8', 'replace')}\n"
+            f"stderr: {result.stderr.decode('utf-8', 'replace')}"
         ) from exc
 
 
+def run_anyr_json(*args: str) -> dict:
+    cmd = (*_anyr_argv(), *args, "--json")
+    print(f"running cmd: {list(cmd)}")
+    return _json_from_result(args, _run_capture(cmd))
+
+
+async def _run_anyr_async(*args: str) -> subprocess.CompletedProcess[bytes]:
+    cmd = (*_anyr_argv(), *args)
+    print(f"running cmd: {list(cmd)}")
+    _install_env_overrides()
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+def run_anyr_json_many(
+    *arg_tuples: tuple[str, ...],
+) -> list[dict | AssertionError]:
+    """Run independent anyr invocations concurrently and parse each result.
+
+    The calls are pipelined through asyncio subprocesses so their
+    server round-trips overlap; only use this for operations with no
+    ordering dependency between them. Failures are returned in place
+    as AssertionError instances rather than raised, so callers can
+    record a successful sibling (for example a fixture id needed for
+    cleanup) before failing on its batch partner.
+    """
+
+    async def gather() -> list[subprocess.CompletedProcess[bytes]]:
+        return await asyncio.gather(
+            *(_run_anyr_async(*args, "--json") for args in arg_tuples)
+        )
+
+    parsed: list[dict | AssertionError] = []
+    for args, result in zip(arg_tuples, asyncio.run(gather())):
+        try:
+            parsed.append(_json_from_result(args, result))
+        except AssertionError as exc:
+            parsed.append(exc)
+    return parsed
+
+
+# every subcommand path whose --help must succeed; shared with the
+# parametrized pytest cases in test_help.py
+HELP_ARGS: list[tuple[str, ...]] = [
+    (),
+    ("md",),
+    ("md", "get"),
+    ("md", "update"),
+    ("md", "edit"),
+    ("backup",),
+    ("backup", "create"),
+    ("backup", "restore"),
+    ("backup", "list"),
+    ("backup", "manifest"),
+    ("backup", "diff"),
+    ("backup", "extract"),
+    ("backup", "export"),
+    ("backup", "import"),
+    ("mcp",),
+    ("auth",),
+    ("auth", "login"),
+    ("auth", "logout"),
+    ("auth", "status"),
+    ("auth", "set-http"),
+    ("auth", "set-grpc"),
+    ("space",),
+    ("space", "list"),
+    ("space", "get"),
+    ("space", "create"),
+    ("space", "update"),
+    ("space", "delete"),
+    ("space", "invite"),
+    ("space", "invite", "show"),
+    ("space", "invite", "create"),
+    ("space", "invite", "revoke"),
+    ("space", "enable-sharing"),
+    ("space", "disable-sharing"),
+    ("object",),
+    ("object", "list"),
+    ("object", "get"),
+    ("object", "create"),
+    ("object", "update"),
+    ("object", "delete"),
+    ("file",),
+    ("file", "list"),
+    ("file", "search"),
+    ("file", "get"),
+    ("file", "update"),
+    ("file", "delete"),
+    ("file", "download"),
+    ("file", "upload"),
+    ("type",),
+    ("type", "list"),
+    ("type", "get"),
+    ("type", "create"),
+    ("type", "update"),
+    ("type", "delete"),
+    ("property",),
+    ("property", "list"),
+    ("property", "get"),
+    ("property", "create"),
+    ("property", "update"),
+    ("property", "delete"),
+    ("member",),
+    ("member", "list"),
+    ("member", "get"),
+    ("tag",),
+    ("tag", "list"),
+    ("tag", "get"),
+    ("tag", "create"),
+    ("tag", "update"),
+    ("tag", "delete"),
+    ("template",),
+    ("template", "list"),
+    ("template", "get"),
+    ("search",),
+    ("list",),
+    ("list", "objects"),
+    ("list", "views"),
+    ("list", "add"),
+    ("list", "remove"),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def help_status_by_path() -> dict[tuple[str, ...], bool]:
+    # one debug list-commands subprocess covers the whole help surface
+    data = run_anyr_json("debug", "list-commands")
+    return {tuple(entry["path"]): entry["help_ok"] for entry in data["commands"]}
+
+
+def require_space_prefix() -> str:
+    if not anyr_bin():
+        raise unittest.SkipTest("anyr binary not found; set ANYR_BIN or add to PATH")
+    prefix = os.environ.get("ANYTYPE_TEST_SPACE_PREFIX")
+    if not prefix:
+        raise unittest.SkipTest("ANYTYPE_TEST_SPACE_PREFIX is not set")
+    if len(prefix) > 485 or not all(
+        char.isascii() and (char.isalnum() or char in "-_") for char in prefix
+    ):
+        raise unittest.SkipTest("ANYTYPE_TEST_SPACE_PREFIX is invalid")
+    return prefix
+
+
 class TestAnyrCommands(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        if not anyr_bin():
-            raise unittest.SkipTest(
-                "anyr binary not found; set ANYR_BIN or add to PATH"
-            )
-        prefix = os.environ.get("ANYTYPE_TEST_SPACE_PREFIX")
-        if not prefix:
-            raise unittest.SkipTest("ANYTYPE_TEST_SPACE_PREFIX is not set")
-        if len(prefix) > 485 or not all(
-            char.isascii() and (char.isalnum() or char in "-_") for char in prefix
-        ):
-            raise unittest.SkipTest("ANYTYPE_TEST_SPACE_PREFIX is invalid")
-        cls.space_prefix = prefix
-
-    def assert_help_ok(self, *args: str) -> None:
-        result = run_help(*args)
-        self.assertEqual(
-            result.returncode,
-            0,
-            msg=f"help failed for {' '.join(args)}: {result.stderr.strip()}",
-        )
-
-    def test_top_level(self) -> None:
-        self.assert_help_ok()
+        cls.space_prefix = require_space_prefix()
 
     def test_consolidated_cli_surfaces(self) -> None:
-        self.assert_help_ok("md")
-        self.assert_help_ok("md", "get")
-        self.assert_help_ok("md", "update")
-        self.assert_help_ok("md", "edit")
-        self.assert_help_ok("backup")
-        for command in (
-            "create",
-            "restore",
-            "list",
-            "manifest",
-            "diff",
-            "extract",
-            "export",
-            "import",
-        ):
-            self.assert_help_ok("backup", command)
-        self.assert_help_ok("mcp")
-
         version = run_anyr("--version")
         self.assertEqual(version.returncode, 0, msg=version.stderr)
         self.assertTrue(version.stdout.startswith("anyr "))
@@ -133,28 +341,6 @@ class TestAnyrCommands(unittest.TestCase):
             duplicate = run_anyr("mcp", "init", "-c", config_path)
             self.assertNotEqual(duplicate.returncode, 0)
 
-    def test_auth(self) -> None:
-        self.assert_help_ok("auth")
-        self.assert_help_ok("auth", "login")
-        self.assert_help_ok("auth", "logout")
-        self.assert_help_ok("auth", "status")
-        self.assert_help_ok("auth", "set-http")
-        self.assert_help_ok("auth", "set-grpc")
-
-    def test_space(self) -> None:
-        self.assert_help_ok("space")
-        self.assert_help_ok("space", "list")
-        self.assert_help_ok("space", "get")
-        self.assert_help_ok("space", "create")
-        self.assert_help_ok("space", "update")
-        self.assert_help_ok("space", "delete")
-        self.assert_help_ok("space", "invite")
-        self.assert_help_ok("space", "invite", "show")
-        self.assert_help_ok("space", "invite", "create")
-        self.assert_help_ok("space", "invite", "revoke")
-        self.assert_help_ok("space", "enable-sharing")
-        self.assert_help_ok("space", "disable-sharing")
-
     def test_space_delete_accepts_bash_stdin_confirmation(self) -> None:
         space_name = "xtest-123-xyz"
         existing = run_anyr("space", "get", space_name)
@@ -222,270 +408,310 @@ class TestAnyrCommands(unittest.TestCase):
                     created_space_id,
                 )
 
-    def test_object(self) -> None:
-        self.assert_help_ok("object")
-        self.assert_help_ok("object", "list")
-        self.assert_help_ok("object", "get")
-        self.assert_help_ok("object", "create")
-        self.assert_help_ok("object", "update")
-        self.assert_help_ok("object", "delete")
-
-    def test_file(self) -> None:
-        self.assert_help_ok("file")
-        self.assert_help_ok("file", "list")
-        self.assert_help_ok("file", "search")
-        self.assert_help_ok("file", "get")
-        self.assert_help_ok("file", "update")
-        self.assert_help_ok("file", "delete")
-        self.assert_help_ok("file", "download")
-        self.assert_help_ok("file", "upload")
-
-    def test_type(self) -> None:
-        self.assert_help_ok("type")
-        self.assert_help_ok("type", "list")
-        self.assert_help_ok("type", "get")
-        self.assert_help_ok("type", "create")
-        self.assert_help_ok("type", "update")
-        self.assert_help_ok("type", "delete")
-
-    def test_property(self) -> None:
-        self.assert_help_ok("property")
-        self.assert_help_ok("property", "list")
-        self.assert_help_ok("property", "get")
-        self.assert_help_ok("property", "create")
-        self.assert_help_ok("property", "update")
-        self.assert_help_ok("property", "delete")
-
-    def test_member(self) -> None:
-        self.assert_help_ok("member")
-        self.assert_help_ok("member", "list")
-        self.assert_help_ok("member", "get")
-
-    def test_tag(self) -> None:
-        self.assert_help_ok("tag")
-        self.assert_help_ok("tag", "list")
-        self.assert_help_ok("tag", "get")
-        self.assert_help_ok("tag", "create")
-        self.assert_help_ok("tag", "update")
-        self.assert_help_ok("tag", "delete")
-
-    def test_template(self) -> None:
-        self.assert_help_ok("template")
-        self.assert_help_ok("template", "list")
-        self.assert_help_ok("template", "get")
-
-    def test_search(self) -> None:
-        self.assert_help_ok("search")
-
-    def test_list(self) -> None:
-        self.assert_help_ok("list")
-        self.assert_help_ok("list", "objects")
-        self.assert_help_ok("list", "views")
-        self.assert_help_ok("list", "add")
-        self.assert_help_ok("list", "remove")
-
-    def test_real_operations(self) -> None:
+
+class TestRealOperations(unittest.TestCase):
+    """CRUD operations against a real server.
+
+    The expensive fixtures -- space discovery plus the disposable test
+    type, property, tag, and object -- are created once in setUpClass
+    and shared by every test method; the methods themselves only
+    perform reads and updates that are independent of each other.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.space_prefix = require_space_prefix()
         spaces = run_anyr_json("space", "list", "--limit", "200").get("items", [])
-        prefix = self.space_prefix.casefold()
+        prefix = cls.space_prefix.casefold()
         matches = [
             item
             for item in spaces
             if isinstance(item.get("name"), str)
-            and item["name"][: len(self.space_prefix)].casefold() == prefix
+            and item["name"][: len(cls.space_prefix)].casefold() == prefix
         ]
         if len(matches) != 1:
-            self.skipTest(
+            raise unittest.SkipTest(
                 "real operations require exactly one current "
                 "ANYTYPE_TEST_SPACE_PREFIX-matching space"
             )
         space_id = matches[0].get("id")
         if not isinstance(space_id, str) or not space_id:
-            self.fail("prefix-matching space is missing an id")
+            raise AssertionError("prefix-matching space is missing an id")
+        cls.space_id = space_id
+
         space = run_anyr_json("space", "get", space_id)
         space_name = space.get("name")
-        suffix = str(int(time.time() * 1000))
-        type_key = f"cli_test_type_{suffix}"
-        type_name = f"CLI Test Type {suffix}"
-        prop_key = f"cli_test_status_{suffix}"
-        prop_name = f"CLI Test Status {suffix}"
-        type_prop_key = f"note_{suffix}"
-        obj_name = f"CLI Test Object {suffix}"
-        updated_obj_name = f"{obj_name} Updated"
-        tag_key = f"doing_{suffix}"
-
-        created_type_id = None
-        created_prop_id = None
-        created_tag_id = None
-        created_obj_id = None
+        if (
+            space_name
+            and len([item for item in spaces if item.get("name") == space_name]) != 1
+        ):
+            space_name = None
+        cls.space_name = space_name
 
+        suffix = str(int(time.time() * 1000))
+        cls.type_key = f"cli_test_type_{suffix}"
+        cls.type_name = f"CLI Test Type {suffix}"
+        cls.prop_key = f"cli_test_status_{suffix}"
+        cls.prop_name = f"CLI Test Status {suffix}"
+        cls.type_prop_key = f"note_{suffix}"
+        cls.obj_name = f"CLI Test Object {suffix}"
+        cls.tag_key = f"doing_{suffix}"
+
+        cls.created_type_id = None
+        cls.created_prop_id = None
+        cls.created_tag_id = None
+        cls.created_obj_id = None
         try:
-            if (
-                space_name
-                and len([item for item in spaces if item.get("name") == space_name])
-                != 1
-            ):
-                space_name = None
-
-            typ = run_anyr_json(
-                "type",
-                "create",
-                space_id,
-                type_key,
-                type_name,
-                "-p",
-                f"{type_prop_key}:text:Note",
+            # the type and property creates only depend on the space, so
+            # pipeline them; the tag needs the property and the object
+            # needs the type, so those two form a second concurrent batch
+            typ, prop = run_anyr_json_many(
+                (
+                    "type",
+                    "create",
+                    space_id,
+                    cls.type_key,
+                    cls.type_name,
+                    "-p",
+                    f"{cls.type_prop_key}:text:Note",
+                ),
+                (
+                    "property",
+                    "create",
+                    space_id,
+                    cls.prop_name,
+                    "select",
+                    "--key",
+                    cls.prop_key,
+                    "--tag",
+                    "Todo:blue",
+                ),
             )
-            created_type_id = typ.get("id")
-            self.assertIsNotNone(created_type_id, "type create missing id")
-
-            type_by_key = run_anyr_json("type", "get", space_id, type_key)
-            self.assertEqual(
-                type_by_key.get("id"), created_type_id, "type get by key mismatch"
+            # record ids for whatever landed before failing, so _cleanup
+            # can delete a sibling that succeeded while its batch
+            # partner failed
+            if not isinstance(typ, AssertionError):
+                cls.created_type_id = typ.get("id")
+            if not isinstance(prop, AssertionError):
+                cls.created_prop_id = prop.get("id")
+            for payload in (typ, prop):
+                if isinstance(payload, AssertionError):
+                    raise payload
+            if cls.created_type_id is None:
+                raise AssertionError("type create missing id")
+            if cls.created_prop_id is None:
+                raise AssertionError("property create missing id")
+
+            tag, obj = run_anyr_json_many(
+                (
+                    "tag",
+                    "create",
+                    space_id,
+                    cls.prop_key,
+                    "Doing",
+                    "yellow",
+                    "--key",
+                    cls.tag_key,
+                ),
+                (
+                    "object",
+                    "create",
+                    "--name",
+                    cls.obj_name,
+                    "--body",
+                    "# hello world",
+                    "-p",
+                    f"{cls.type_prop_key}=123_text_data",
+                    cls.space_name or space_id,
+                    f"@{cls.type_key}",
+                ),
             )
+            if not isinstance(tag, AssertionError):
+                cls.created_tag_id = tag.get("id")
+            if not isinstance(obj, AssertionError):
+                cls.created_obj_id = obj.get("id")
+            for payload in (tag, obj):
+                if isinstance(payload, AssertionError):
+                    raise payload
+            if cls.created_tag_id is None:
+                raise AssertionError("tag create missing id")
+            if cls.created_obj_id is None:
+                raise AssertionError("object create missing id")
+        except BaseException:
+            # tearDownClass is not called when setUpClass raises
+            cls._cleanup()
+            raise
 
-            type_by_name = run_anyr_json("type", "get", space_id, type_name)
-            self.assertEqual(
-                type_by_name.get("id"), created_type_id, "type get by name mismatch"
-            )
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._cleanup()
 
-            updated_type = run_anyr_json(
-                "type",
-                "update",
-                space_id,
-                type_key,
-                "--name",
-                f"{type_name} Updated",
-            )
-            self.assertEqual(
-                updated_type.get("id"), created_type_id, "type update by key mismatch"
-            )
+    @classmethod
+    def _cleanup(cls) -> None:
+        if cls.created_obj_id:
+            run_anyr("object", "delete", cls.space_id, cls.created_obj_id)
+        if cls.created_tag_id:
+            run_anyr("tag", "delete", cls.space_id, cls.prop_key, cls.tag_key)
+        if cls.created_prop_id:
+            run_anyr("property", "delete", cls.space_id, cls.prop_key)
+        if cls.created_type_id:
+            run_anyr("type", "delete", cls.space_id, cls.type_key)
+
+    def test_type_get_and_update(self) -> None:
+        type_by_key = run_anyr_json("type", "get", self.space_id, self.type_key)
+        self.assertEqual(
+            type_by_key.get("id"), self.created_type_id, "type get by key mismatch"
+        )
 
-            prop = run_anyr_json(
-                "property",
-                "create",
-                space_id,
-                prop_name,
-                "select",
-                "--key",
-                prop_key,
-                "--tag",
-                "Todo:blue",
-            )
-            created_prop_id = prop.get("id")
-            self.assertIsNotNone(created_prop_id, "property create missing id")
+        type_by_name = run_anyr_json("type", "get", self.space_id, self.type_name)
+        self.assertEqual(
+            type_by_name.get("id"), self.created_type_id, "type get by name mismatch"
+        )
 
-            prop_by_key = run_anyr_json("property", "get", space_id, prop_key)
-            self.assertEqual(
-                prop_by_key.get("id"), created_prop_id, "property get by key mismatch"
-            )
+        updated_type = run_anyr_json(
+            "type",
+            "update",
+            self.space_id,
+            self.type_key,
+            "--name",
+            f"{self.type_name} Updated",
+        )
+        self.assertEqual(
+            updated_type.get("id"), self.created_type_id, "type update by key mismatch"
+        )
 
-            updated_prop = run_anyr_json(
-                "property",
-                "update",
-                space_id,
-                prop_key,
-                "--name",
-                f"{prop_name} Updated",
-            )
-            self.assertEqual(
-                updated_prop.get("id"),
-                created_prop_id,
-                "property update by key mismatch",
-            )
+    def test_property_get_and_update(self) -> None:
+        prop_by_key = run_anyr_json("property", "get", self.space_id, self.prop_key)
+        self.assertEqual(
+            prop_by_key.get("id"), self.created_prop_id, "property get by key mismatch"
+        )
 
-            tag = run_anyr_json(
-                "tag",
-                "create",
-                space_id,
-                prop_key,
-                "Doing",
-                "yellow",
-                "--key",
-                tag_key,
-            )
-            created_tag_id = tag.get("id")
-            self.assertIsNotNone(created_tag_id, "tag create missing id")
+        updated_prop = run_anyr_json(
+            "property",
+            "update",
+            self.space_id,
+            self.prop_key,
+            "--name",
+            f"{self.prop_name} Updated",
+        )
+        self.assertEqual(
+            updated_prop.get("id"),
+            self.created_prop_id,
+            "property update by key mismatch",
+        )
 
-            tag_by_key = run_anyr_json("tag", "get", space_id, prop_key, tag_key)
-            self.assertEqual(
-                tag_by_key.get("id"), created_tag_id, "tag get by key mismatch"
-            )
+    def test_tag_get_and_update(self) -> None:
+        tag_by_key = run_anyr_json(
+            "tag", "get", self.space_id, self.prop_key, self.tag_key
+        )
+        self.assertEqual(
+            tag_by_key.get("id"), self.created_tag_id, "tag get by key mismatch"
+        )
 
-            updated_tag = run_anyr_json(
-                "tag",
-                "update",
-                space_id,
-                prop_key,
-                tag_key,
-                "--name",
-                "Done",
-            )
-            self.assertEqual(
-                updated_tag.get("id"), created_tag_id, "tag update by key mismatch"
-            )
+        updated_tag = run_anyr_json(
+            "tag",
+            "update",
+            self.space_id,
+            self.prop_key,
+            self.tag_key,
+            "--name",
+            "Done",
+        )
+        self.assertEqual(
+            updated_tag.get("id"), self.created_tag_id, "tag update by key mismatch"
+        )
 
-            obj = run_anyr_json(
-                "object",
-                "create",
-                "--name",
-                obj_name,
-                "--body",
-                "# hello world",
-                "-p",
-                f"{type_prop_key}=123_text_data",
-                space_name or space_id,
-                f"@{type_key}",
-            )
-            created_obj_id = obj.get("id")
-            self.assertIsNotNone(created_obj_id, "object create missing id")
-
-            updated_obj = run_anyr_json(
-                "object",
-                "update",
-                space_id,
-                created_obj_id,
-                "--name",
-                updated_obj_name,
-            )
-            self.assertEqual(
-                updated_obj.get("id"), created_obj_id, "object update mismatch"
-            )
+    def test_object_update_and_list(self) -> None:
+        updated_obj = run_anyr_json(
+            "object",
+            "update",
+            self.space_id,
+            self.created_obj_id,
+            "--name",
+            f"{self.obj_name} Updated",
+        )
+        self.assertEqual(
+            updated_obj.get("id"), self.created_obj_id, "object update mismatch"
+        )
 
-            list_by_key = run_anyr_json(
-                "object",
-                "list",
-                "--type",
-                type_key,
-                "--limit",
-                "200",
-                space_name or space_id,
-            )
-            items_by_key = list_by_key.get("items", [])
-            self.assertTrue(
-                any(item.get("id") == created_obj_id for item in items_by_key),
-                "object list by type key missing created object",
-            )
+        list_by_key = run_anyr_json(
+            "object",
+            "list",
+            "--type",
+            self.type_key,
+            "--limit",
+            "200",
+            self.space_name or self.space_id,
+        )
+        items_by_key = list_by_key.get("items", [])
+        self.assertTrue(
+            any(item.get("id") == self.created_obj_id for item in items_by_key),
+            "object list by type key missing created object",
+        )
 
-            list_by_id = run_anyr_json(
-                "object", "list", space_id, "--type", created_type_id, "--limit", "200"
-            )
-            items_by_id = list_by_id.get("items", [])
-            self.assertTrue(
-                any(item.get("id") == created_obj_id for item in items_by_id),
-                "object list by type id missing created object",
+        list_by_id = run_anyr_json(
+            "object",
+            "list",
+            self.space_id,
+            "--type",
+            self.created_type_id,
+            "--limit",
+            "200",
+        )
+        items_by_id = list_by_id.get("items", [])
+        self.assertTrue(
+            any(item.get("id") == self.created_obj_id for item in items_by_id),
+            "object list by type id missing created object",
+        )
+
+        run_anyr_json("template", "list", self.space_id, "@page")
+
+
+class TestHelpSurfaces(unittest.TestCase):
+    """Help coverage for standalone unittest runs.
+
+    The test methods are generated below from HELP_ARGS, one per
+    top-level command group, each checking its entries in the cached
+    debug list-commands dump under subTest. pytest runs the
+    parametrized equivalent in test_help.py instead.
+    """
+
+    __test__ = False  # keep pytest collection on test_help.py
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        if not anyr_bin():
+            raise unittest.SkipTest(
+                "anyr binary not found; set ANYR_BIN or add to PATH"
             )
 
-            run_anyr_json("template", "list", space_id, "@page")
 
-        finally:
-            if created_obj_id:
-                run_anyr("object", "delete", space_id, created_obj_id)
-            if created_tag_id:
-                run_anyr("tag", "delete", space_id, prop_key, tag_key)
-            if created_prop_id:
-                run_anyr("property", "delete", space_id, prop_key)
-            if created_type_id:
-                run_anyr("type", "delete", space_id, type_key)
+def _add_help_tests() -> None:
+    groups: dict[str, list[tuple[str, ...]]] = {}
+    for args in HELP_ARGS:
+        groups.setdefault(args[0] if args else "top_level", []).append(args)
+
+    def make_test(arg_tuples: list[tuple[str, ...]]):
+        def test(self: TestHelpSurfaces) -> None:
+            status = help_status_by_path()
+            for args in arg_tuples:
+                label = " ".join(args) or "top level"
+                with self.subTest(args=label):
+                    self.assertIn(
+                        args, status, f"subcommand missing from help dump: {label}"
+                    )
+                    self.assertTrue(status[args], f"help failed for {label}")
+
+        return test
+
+    for group, arg_tuples in groups.items():
+        name = f"test_help_{group.replace('-', '_')}"
+        test = make_test(arg_tuples)
+        test.__name__ = name
+        setattr(TestHelpSurfaces, name, test)
+
+
+_add_help_tests()
 
 
 if __name__ == "__main__":
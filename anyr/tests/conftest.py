@@ -0,0 +1,18 @@
+import pytest
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "serial: touches real server state; run on a single worker, "
+        'excluded from parallel runs with -m "not serial"',
+    )
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # cli_commands.py stays pytest-free so it can run standalone via
+    # unittest; everything in it mutates real server state, so tag it
+    # serial here instead of with decorators
+    for item in items:
+        if item.module is not None and item.module.__name__ == "cli_commands":
+            item.add_marker(pytest.mark.serial)
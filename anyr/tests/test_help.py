@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+
+"""Parametrized `--help` checks for every anyr subcommand.
+
+A single `anyr debug list-commands` subprocess dumps the help status
+of the whole subcommand tree; the parametrized cases then assert
+in-process against that dump instead of spawning one `--help`
+subprocess per subcommand.
+"""
+
+import pytest
+
+from cli_commands import HELP_ARGS, anyr_bin, help_status_by_path
+
+pytestmark = pytest.mark.skipif(
+    not anyr_bin(), reason="anyr binary not found; set ANYR_BIN or add to PATH"
+)
+
+
+@pytest.fixture(scope="session")
+def help_status() -> dict[tuple[str, ...], bool]:
+    return help_status_by_path()
+
+
+@pytest.mark.parametrize(
+    "args", HELP_ARGS, ids=[" ".join(args) or "top-level" for args in HELP_ARGS]
+)
+def test_help(args: tuple[str, ...], help_status: dict[tuple[str, ...], bool]) -> None:
+    label = " ".join(args) or "top level"
+    assert args in help_status, f"subcommand missing from help dump: {label}"
+    assert help_status[args], f"help failed for {label}"